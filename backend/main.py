@@ -1,20 +1,90 @@
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from motor.motor_asyncio import AsyncIOMotorClient
 from bson import ObjectId
+from pymongo.errors import ConnectionFailure
+import asyncio
 import os
+import time
 from dotenv import load_dotenv, find_dotenv
-from models import Product, CategoryResponse, SubcategoryResponse
-import product_services
 # Try to load env file from both .env and env (for compatibility)
+# before product_services reads MONGODB_URL
 if os.path.exists('env'):
     load_dotenv('env')
 else:
     load_dotenv(find_dotenv())
+from models import Product, CategoryResponse, SubcategoryResponse
+import product_services
+
+# Product pages preloaded during warm-up (the home page requests size=20)
+WARM_PAGE_SIZE = 20
+WARM_PAGES = 3
+RETRY_INITIAL_SECONDS = 2
+RETRY_MAX_SECONDS = 30
+PHASE_MAX_ATTEMPTS = 3
+
+ready = False
+
+
+async def run_phase(name, coro_fn, required=False):
+    """Run a warm-up phase with retries and log how long it took.
+
+    Connection failures are retried until they clear. Other errors are retried
+    PHASE_MAX_ATTEMPTS times; after that a required phase keeps retrying and an
+    optional one is skipped so the replica still becomes ready.
+    """
+    start = time.perf_counter()
+    delay = RETRY_INITIAL_SECONDS
+    attempts = 0
+    while True:
+        try:
+            await coro_fn()
+            break
+        except ConnectionFailure as e:
+            print(f"Startup phase '{name}' could not reach MongoDB, retrying in {delay}s: {e}")
+        except Exception as e:
+            attempts += 1
+            if attempts >= PHASE_MAX_ATTEMPTS and not required:
+                print(f"Startup phase '{name}' skipped after {attempts} attempts: {e}")
+                return
+            print(f"Startup phase '{name}' failed, retrying in {delay}s: {e}")
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, RETRY_MAX_SECONDS)
+    print(f"Startup phase '{name}' completed in {(time.perf_counter() - start) * 1000:.1f} ms")
+
 
+async def preload_products():
+    for page in range(1, WARM_PAGES + 1):
+        await product_services.get_all_products(page, WARM_PAGE_SIZE)
 
-app = FastAPI(title="Fay Jewelry API", version="1.0.0")
+
+async def warm_up():
+    """Connect, build indexes and fill the cache before reporting ready"""
+    global ready
+    start = time.perf_counter()
+    await run_phase("connect", product_services.ping, required=True)
+    await run_phase("indexes", product_services.ensure_indexes)
+    await run_phase("categories", product_services.get_categories)
+    await run_phase("products", preload_products)
+    ready = True
+    print(f"Warm-up completed in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Warm up in the background so liveness checks on / answer immediately
+    warm_up_task = asyncio.create_task(warm_up())
+    yield
+    warm_up_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await warm_up_task
+    product_services.client.close()
+
+
+app = FastAPI(title="Fay Jewelry API", version="1.0.0", lifespan=lifespan)
 
 # CORS middleware
 app.add_middleware(
@@ -36,6 +106,22 @@ app.add_middleware(
 async def root():
     return {"message": "Fay Jewelry API"}
 
+@app.get("/ready")
+async def readiness():
+    """Report readiness once startup warm-up has finished"""
+    if not ready:
+        return JSONResponse(status_code=503, content={"status": "warming up"})
+    return {"status": "ready"}
+
+@app.get("/categories", response_model=CategoryResponse)
+async def get_categories():
+    """Get all product categories"""
+    try:
+        return await product_services.get_categories()
+    except Exception as e:
+        print(f"Error fetching categories: {e}")
+        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+
 @app.get("/products")
 async def get_all_products(page: int = 1, size: int = 10):
     """Get all products with pagination"""